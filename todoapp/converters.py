@@ -0,0 +1,14 @@
+class FastIntConverter:
+    """
+    Path converter for positive task ids.
+    
+    Matches positive integers without leading zeros, so ids like 0 or 007 are
+    rejected by the URL regex before any view code runs.
+    """
+    regex = '[1-9][0-9]*'
+
+    def to_python(self, value):
+        return int(value)
+
+    def to_url(self, value):
+        return str(value)
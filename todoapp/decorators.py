@@ -0,0 +1,39 @@
+from functools import wraps
+
+from .responses import OrjsonResponse
+
+
+def api_login_required(view_func):
+    """
+    Like login_required, but for JSON endpoints.
+    
+    Anonymous requests get a 401 JSON error instead of a redirect to the
+    login page.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return OrjsonResponse({'error': 'Authentication required'}, status=401)
+        return view_func(request, *args, **kwargs)
+    return wrapper
+
+
+def api_require_http_methods(request_method_list):
+    """
+    Like require_http_methods, but for JSON endpoints.
+    
+    Other methods get a 405 JSON error with an Allow header instead of an
+    empty HTML response.
+    """
+    allow = ', '.join(request_method_list)
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in request_method_list:
+                response = OrjsonResponse({'error': 'Method not allowed'}, status=405)
+                response['Allow'] = allow
+                return response
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
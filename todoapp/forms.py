@@ -1,8 +1,47 @@
+import hmac
+from functools import partial
+
 from django import forms
+from django.core.cache import cache
 from django.utils import timezone
-from django.contrib.auth.models import User
+from django.contrib.auth import get_user_model, password_validation
 from django.contrib.auth.forms import AuthenticationForm
 
+# Seconds to remember whether a username is taken
+USERNAME_EXISTS_CACHE_TIMEOUT = 60
+
+
+def _username_cache_key(username):
+    return f"user_exists:{username}"
+
+
+# Task form choices and widgets, built once at import
+_STATUS_CHOICES = (
+    ('pending', 'Pending'),
+    ('in_progress', 'In Progress'),
+    ('completed', 'Completed'),
+)
+_TITLE_ATTRS = {'placeholder': 'Enter task title'}
+_DESCRIPTION_ATTRS = {'rows': 3, 'placeholder': 'Enter task description'}
+_DUE_DATE_ATTRS = {'type': 'datetime-local'}
+
+_TITLE_WIDGET = forms.TextInput(attrs=_TITLE_ATTRS)
+_DESCRIPTION_WIDGET = forms.Textarea(attrs=_DESCRIPTION_ATTRS)
+_DUE_DATE_WIDGET = forms.DateTimeInput(attrs=_DUE_DATE_ATTRS)
+_STATUS_WIDGET = forms.Select()
+
+
+class _FastChoiceField(forms.ChoiceField):
+    """ChoiceField that checks flat choices with a frozenset lookup."""
+    
+    def __init__(self, *, choices=(), **kwargs):
+        super().__init__(choices=choices, **kwargs)
+        self._choice_set = frozenset(str(key) for key, _ in self.choices)
+    
+    def valid_value(self, value):
+        return value in self._choice_set
+
+
 class TaskForm(forms.Form):
     """
     Form for creating and updating tasks.
@@ -14,30 +53,35 @@ class TaskForm(forms.Form):
     
     title = forms.CharField(
         max_length=200,
-        widget=forms.TextInput(attrs={'placeholder': 'Enter task title'}),
+        widget=_TITLE_WIDGET,
         help_text="A short title for the task."
     )
     description = forms.CharField(
         required=False,
-        widget=forms.Textarea(attrs={'rows': 3, 'placeholder': 'Enter task description'}),
+        widget=_DESCRIPTION_WIDGET,
         help_text="Optional detailed description."
     )
     due_date = forms.DateTimeField(
         required=False,
-        widget=forms.DateTimeInput(attrs={'type': 'datetime-local'}),
+        widget=_DUE_DATE_WIDGET,
         help_text="Optional due date and time."
     )
-    status = forms.ChoiceField(
-        choices=[
-            ('pending', 'Pending'),
-            ('in_progress', 'In Progress'),
-            ('completed', 'Completed'),
-        ],
+    status = _FastChoiceField(
+        choices=_STATUS_CHOICES,
         initial='pending',
-        widget=forms.Select(),
+        widget=_STATUS_WIDGET,
         help_text="Current status of the task."
     )
     
+    def __init__(self, *args, now=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._now = now if now is not None else timezone.now()
+    
+    @classmethod
+    def with_now(cls, now):
+        """Return a form factory whose forms all validate against ``now``."""
+        return partial(cls, now=now)
+    
     def clean_title(self):
         """Validate title is not empty and reasonable length."""
         title = self.cleaned_data.get('title')
@@ -50,7 +94,7 @@ class TaskForm(forms.Form):
     def clean_due_date(self):
         """Ensure due date is in the future if provided."""
         due_date = self.cleaned_data.get('due_date')
-        if due_date and due_date < timezone.now():
+        if due_date and due_date < self._now:
             raise forms.ValidationError("Due date must be in the future.")
         return due_date
 
@@ -71,7 +115,7 @@ class UserRegistrationForm(forms.ModelForm):
     )
     
     class Meta:
-        model = User
+        model = get_user_model()
         fields = ['username', 'email']
         widgets = {
             'username': forms.TextInput(attrs={'placeholder': 'Enter username'}),
@@ -82,24 +126,69 @@ class UserRegistrationForm(forms.ModelForm):
             'email': 'Enter a valid email address.',
         }
     
-    def clean_username(self):
-        """Ensure username is unique."""
-        username = self.cleaned_data.get('username')
-        if User.objects.filter(username=username).exists():
-            raise forms.ValidationError("This username is already taken.")
-        return username
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._user_cls = self._meta.model
+    
+    def _username_taken(self, username):
+        """
+        Return True if ``username`` already belongs to a user.
+        
+        Only a taken name is cached, so repeated probes for it skip the
+        database. A name that looks free is always checked against the unique
+        index on auth_user.username, since it may have been created since (by
+        the admin, or another worker with its own cache).
+        """
+        key = _username_cache_key(username)
+        if cache.get(key):
+            return True
+        if not self._user_cls.objects.filter(username=username).exists():
+            return False
+        cache.set(key, True, USERNAME_EXISTS_CACHE_TIMEOUT)
+        return True
+    
+    def validate_unique(self):
+        """Run model unique checks except username, which clean covers."""
+        exclude = self._get_validation_exclusions()
+        exclude.add('username')
+        try:
+            self.instance.validate_unique(exclude=exclude)
+        except forms.ValidationError as e:
+            self._update_errors(e)
+    
+    def clean_password(self):
+        """
+        Run the validators from AUTH_PASSWORD_VALIDATORS.
+        
+        Django builds that validator list once per process and reuses it.
+        """
+        password = self.cleaned_data.get('password')
+        if password:
+            password_validation.validate_password(password)
+        return password
+    
+    @staticmethod
+    def _passwords_match(password, confirm_password):
+        """Compare the two entries in constant time."""
+        return hmac.compare_digest(password.encode(), confirm_password.encode())
     
     def clean(self):
-        """Validate that passwords match."""
+        """
+        Validate that the username is free and the passwords match.
+        
+        The username lookup is skipped when the password was already rejected
+        by AUTH_PASSWORD_VALIDATORS, since the form fails either way.
+        """
         cleaned_data = super().clean()
+        username = cleaned_data.get('username')
         password = cleaned_data.get('password')
         confirm_password = cleaned_data.get('confirm_password')
         
-        if password and confirm_password and password != confirm_password:
-            raise forms.ValidationError("Passwords do not match.")
+        if username and not self.has_error('password') and self._username_taken(username):
+            self.add_error('username', "This username is already taken.")
         
-        if password and len(password) < 8:
-            raise forms.ValidationError("Password must be at least 8 characters long.")
+        if password and confirm_password and not self._passwords_match(password, confirm_password):
+            raise forms.ValidationError("Passwords do not match.")
         
         return cleaned_data
     
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todoapp', '0003_delete_task'),
+    ]
+
+    operations = [
+        # Tasks are accessed with raw SQL, so the table is managed here rather
+        # than through a model. IF NOT EXISTS keeps this safe for databases
+        # where the table was created at import time by earlier versions.
+        migrations.RunSQL(
+            sql="""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    title VARCHAR(200) NOT NULL,
+                    description TEXT,
+                    due_date DATETIME,
+                    status VARCHAR(20) DEFAULT 'pending',
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES auth_user(id)
+                )
+            """,
+            reverse_sql="DROP TABLE IF EXISTS tasks",
+        ),
+    ]
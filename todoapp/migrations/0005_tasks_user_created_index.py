@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todoapp', '0004_create_tasks_table'),
+    ]
+
+    operations = [
+        # Serves get_tasks' "WHERE user_id = ? ORDER BY created_at DESC, id DESC"
+        # as an index range scan with no separate sort step.
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX IF NOT EXISTS idx_tasks_user_created
+                ON tasks (user_id, created_at DESC, id DESC)
+            """,
+            reverse_sql="DROP INDEX IF EXISTS idx_tasks_user_created",
+        ),
+    ]
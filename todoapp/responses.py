@@ -0,0 +1,27 @@
+import orjson
+from django.http import HttpResponse
+
+
+def dumps(data):
+    """Serialize ``data`` to JSON bytes the way OrjsonResponse does."""
+    return orjson.dumps(data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+
+
+class OrjsonResponse(HttpResponse):
+    """
+    Drop-in replacement for JsonResponse that serializes with orjson.
+    
+    Aware datetimes are written with a "Z" suffix, as DjangoJSONEncoder does.
+    Naive datetimes, such as the created_at/updated_at values SQLite's
+    CURRENT_TIMESTAMP fills in, are UTC and are written the same way.
+    Like JsonResponse, only dicts are accepted unless safe=False is passed.
+    """
+
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                "In order to allow non-dict objects to be serialized set the "
+                "safe parameter to False."
+            )
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps(data), **kwargs)
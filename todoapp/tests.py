@@ -1,14 +1,48 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta
+from functools import lru_cache
 from .forms import UserRegistrationForm, UserLoginForm, TaskForm
+from .views import create_task, create_tasks_bulk
 from django.test import Client
 from django.urls import reverse
+from django.db import connection
 from django.contrib.messages import get_messages
-import json
-
-class UserRegistrationFormTest(TestCase):
+import orjson
+
+@lru_cache(maxsize=None)
+def _url(name, *args):
+    """Reverse a URL name once per process; reversing has no side effects."""
+    return reverse(name, args=args)
+
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class FastPasswordTestCase(TestCase):
+    """
+    Base test case that hashes passwords with MD5 to keep user setup cheap.
+    
+    Tests use a per-process in-memory cache instead of the project's shared
+    on-disk one, so they neither clear a running server's cache nor see
+    entries from it or from parallel test workers. The cache is cleared after
+    each test, since database rollbacks can reuse ids that cached entries are
+    keyed on.
+    """
+
+    def tearDown(self):
+        cache.clear()
+        super().tearDown()
+
+    def _post_json(self, url, payload):
+        return self.client.generic('POST', url, orjson.dumps(payload), content_type='application/json')
+
+    def _put_json(self, url, payload):
+        return self.client.generic('PUT', url, orjson.dumps(payload), content_type='application/json')
+
+class UserRegistrationFormTest(FastPasswordTestCase):
     def test_valid_form(self):
         data = {
             'username': 'newuser',
@@ -42,7 +76,64 @@ class UserRegistrationFormTest(TestCase):
         self.assertFalse(form.is_valid())
         self.assertIn('username', form.errors)
 
-class UserLoginFormTest(TestCase):
+    def test_short_password_skips_username_query(self):
+        data = {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password': 'short',
+            'confirm_password': 'short'
+        }
+        form = UserRegistrationForm(data=data)
+        with self.assertNumQueries(0):
+            self.assertFalse(form.is_valid())
+        self.assertIn('password', form.errors)
+
+    @override_settings(AUTH_PASSWORD_VALIDATORS=[])
+    def test_short_password_duplicate_username_without_validators(self):
+        User.objects.create_user(username='existing', password='pass')
+        data = {
+            'username': 'existing',
+            'email': 'new@example.com',
+            'password': 'short12',
+            'confirm_password': 'short12'
+        }
+        form = UserRegistrationForm(data=data)
+        self.assertFalse(form.is_valid())
+        self.assertIn('username', form.errors)
+
+    def test_invalid_form_common_password(self):
+        data = {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password': 'password123',
+            'confirm_password': 'password123'
+        }
+        form = UserRegistrationForm(data=data)
+        self.assertFalse(form.is_valid())
+        self.assertIn('password', form.errors)
+
+    def test_username_taken_after_probe_is_rejected(self):
+        # A "free" answer is never cached, whether the name is then taken by
+        # this form or created elsewhere
+        for username, create in (
+            ('newuser', lambda form: form.save()),
+            ('bob', lambda form: User.objects.create_user(username='bob', password='pass')),
+        ):
+            with self.subTest(username=username):
+                data = {
+                    'username': username,
+                    'email': f'{username}@example.com',
+                    'password': 'strongpass123',
+                    'confirm_password': 'strongpass123'
+                }
+                form = UserRegistrationForm(data=data)
+                self.assertTrue(form.is_valid())
+                create(form)
+                form = UserRegistrationForm(data=data)
+                self.assertFalse(form.is_valid())
+                self.assertIn('username', form.errors)
+
+class UserLoginFormTest(FastPasswordTestCase):
     def setUp(self):
         self.user = User.objects.create_user(username='testuser', password='testpass')
 
@@ -56,7 +147,7 @@ class UserLoginFormTest(TestCase):
         form = UserLoginForm(data=data)
         self.assertFalse(form.is_valid())
 
-class TaskFormTest(TestCase):
+class TaskFormTest(FastPasswordTestCase):
     def setUp(self):
         self.user = User.objects.create_user(username='testuser', password='testpass')
 
@@ -91,62 +182,98 @@ class TaskFormTest(TestCase):
         self.assertFalse(form.is_valid())
         self.assertIn('due_date', form.errors)
 
-class ViewTests(TestCase):
+    def test_invalid_form_unknown_status(self):
+        data = {
+            'title': 'Task',
+            'description': 'Description',
+            'status': 'archived'
+        }
+        form = TaskForm(data=data)
+        self.assertFalse(form.is_valid())
+        self.assertIn('status', form.errors)
+
+    def test_with_now_uses_shared_timestamp(self):
+        now = timezone.now() - timedelta(days=2)
+        data = {
+            'title': 'Task',
+            'description': 'Description',
+            'status': 'pending',
+            'due_date': (timezone.now() - timedelta(days=1)).strftime('%Y-%m-%dT%H:%M')
+        }
+        form_class = TaskForm.with_now(now)
+        self.assertTrue(form_class(data=data).is_valid())
+
+class ViewTests(FastPasswordTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser', password='testpass')
+        cls.task_id = create_task(
+            user_id=cls.user.id,
+            title='Test Task',
+            description='Test Description',
+            due_date=None,
+            status='pending'
+        )
+
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create_user(username='testuser', password='testpass')
-        self.client.login(username='testuser', password='testpass')
-        # Create a task via API
-        response = self.client.post(reverse('api_tasks'), data=json.dumps({
-            'title': 'Test Task',
-            'description': 'Test Description',
-            'status': 'pending'
-        }), content_type='application/json')
-        self.task_id = response.json()['id']
+        self.client.force_login(self.user)
 
     def test_home_view_unauthenticated(self):
         self.client.logout()
-        response = self.client.get(reverse('home'))
+        response = self.client.get(_url('home'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Welcome to the Todo App')
 
+    def test_home_view_unauthenticated_cached(self):
+        self.client.logout()
+        response = self.client.get(_url('home'))
+        self.assertIn('Cookie', response['Vary'])
+        # The second request is answered from the cache without rendering
+        response = self.client.get(_url('home'))
+        self.assertContains(response, 'Welcome to the Todo App')
+        self.assertEqual(response.templates, [])
+
     def test_home_view_authenticated(self):
-        self.client.login(username='testuser', password='testpass')
-        # Create a task
-        self.client.post(reverse('api_tasks'), data=json.dumps({
-            'title': 'Test Task',
-            'description': 'Test Description',
-            'status': 'pending'
-        }), content_type='application/json')
-        response = self.client.get(reverse('home'))
+        response = self.client.get(_url('home'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Task')
 
+    def test_home_view_task_list_query_count(self):
+        create_tasks_bulk(self.user.id, [{'title': f'Task {i}'} for i in range(5)])
+        # User lookup and one SELECT for the whole list
+        with self.assertNumQueries(2):
+            response = self.client.get(_url('home'))
+        self.assertContains(response, 'Task 4')
+
     def test_home_view_add_task(self):
-        self.client.login(username='testuser', password='testpass')
         data = {
             'title': 'New Task',
             'description': 'New Description',
             'status': 'pending'
         }
-        response = self.client.post(reverse('home'), data)
-        self.assertEqual(response.status_code, 302)  # Redirect to home
+        response = self.client.post(_url('home'), data)
+        self.assertRedirects(response, _url('home'), status_code=303)
         # Check via API
-        response = self.client.get(reverse('api_tasks'))
+        response = self.client.get(_url('api_tasks'))
         data = response.json()
         self.assertEqual(len(data['tasks']), 2)
 
+    def test_home_view_task_list_fragment_invalidated(self):
+        self.assertContains(self.client.get(_url('home')), 'Test Task')
+        create_task(self.user.id, 'Another Task', '', None, 'pending')
+        self.assertContains(self.client.get(_url('home')), 'Another Task')
+
     def test_register_view_get(self):
         self.client.logout()
-        response = self.client.get(reverse('register'))
+        response = self.client.get(_url('register'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'User Registration')
 
     def test_register_view_authenticated_redirect(self):
-        self.client.login(username='testuser', password='testpass')
-        response = self.client.get(reverse('register'))
+        response = self.client.get(_url('register'))
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse('home'))
+        self.assertRedirects(response, _url('home'))
 
     def test_register_view_post_valid(self):
         self.client.logout()
@@ -156,8 +283,8 @@ class ViewTests(TestCase):
             'password': 'strongpass123',
             'confirm_password': 'strongpass123'
         }
-        response = self.client.post(reverse('register'), data)
-        self.assertEqual(response.status_code, 302)
+        response = self.client.post(_url('register'), data)
+        self.assertEqual(response.status_code, 303)
         self.assertTrue(User.objects.filter(username='newuser').exists())
 
     def test_register_view_post_invalid(self):
@@ -168,189 +295,290 @@ class ViewTests(TestCase):
             'password': 'pass',
             'confirm_password': 'pass'
         }
-        response = self.client.post(reverse('register'), data)
+        response = self.client.post(_url('register'), data)
         self.assertEqual(response.status_code, 200)
         self.assertFalse(User.objects.filter(username='newuser').exists())
 
     def test_login_view_get(self):
         self.client.logout()
-        response = self.client.get(reverse('login'))
+        response = self.client.get(_url('login'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'User Login')
 
     def test_login_view_authenticated_redirect(self):
-        self.client.login(username='testuser', password='testpass')
-        response = self.client.get(reverse('login'))
+        response = self.client.get(_url('login'))
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse('home'))
+        self.assertRedirects(response, _url('home'))
 
     def test_login_view_post_valid(self):
         data = {'username': 'testuser', 'password': 'testpass'}
-        response = self.client.post(reverse('login'), data)
+        response = self.client.post(_url('login'), data)
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse('home'))
+        self.assertRedirects(response, _url('home'))
 
     def test_login_view_post_invalid(self):
         self.client.logout()
         data = {'username': 'testuser', 'password': 'wrong'}
-        response = self.client.post(reverse('login'), data)
+        response = self.client.post(_url('login'), data)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Please enter a correct username and password')
 
     def test_logout_view(self):
-        self.client.login(username='testuser', password='testpass')
-        response = self.client.get(reverse('logout'))
+        response = self.client.get(_url('logout'))
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse('home'))
+        self.assertRedirects(response, _url('home'))
+
+    def test_logout_ends_cached_session(self):
+        session_key = self.client.session.session_key
+        # Load the session into the cache first
+        self.client.get(_url('home'))
+        self.client.get(_url('logout'))
+        self.assertFalse(self.client.session.exists(session_key))
 
     def test_edit_task_view_get(self):
-        self.client.login(username='testuser', password='testpass')
-        # Create a task
-        response = self.client.post(reverse('api_tasks'), data=json.dumps({
-            'title': 'Test Task',
-            'description': 'Test Description',
-            'status': 'pending'
-        }), content_type='application/json')
-        task_id = response.json()['id']
-        response = self.client.get(reverse('edit_task', args=[task_id]))
+        with self.assertNumQueries(2):
+            response = self.client.get(_url('edit_task', self.task_id))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Edit Task')
 
     def test_edit_task_view_post_valid(self):
-        self.client.login(username='testuser', password='testpass')
-        # Create a task
-        response = self.client.post(reverse('api_tasks'), data=json.dumps({
-            'title': 'Test Task',
-            'description': 'Test Description',
-            'status': 'pending'
-        }), content_type='application/json')
-        task_id = response.json()['id']
         data = {
             'title': 'Updated Task',
             'description': 'Updated Description',
             'status': 'completed'
         }
-        response = self.client.post(reverse('edit_task', args=[task_id]), data)
-        self.assertEqual(response.status_code, 302)
+        with self.assertNumQueries(2):
+            response = self.client.post(_url('edit_task', self.task_id), data)
+        self.assertEqual(response.status_code, 303)
         # Check via API
-        response = self.client.get(reverse('api_task_detail', args=[task_id]))
+        response = self.client.get(_url('api_task_detail', self.task_id))
         task_data = response.json()
         self.assertEqual(task_data['title'], 'Updated Task')
 
     def test_edit_task_view_wrong_user(self):
-        # Create task for testuser
-        self.client.login(username='testuser', password='testpass')
-        response = self.client.post(reverse('api_tasks'), data=json.dumps({
-            'title': 'Test Task',
-            'description': 'Test Description',
-            'status': 'pending'
-        }), content_type='application/json')
-        task_id = response.json()['id']
         # Login as user2
         user2 = User.objects.create_user(username='user2', password='pass')
-        self.client.login(username='user2', password='pass')
-        response = self.client.get(reverse('edit_task', args=[task_id]))
+        self.client.force_login(user2)
+        with self.assertNumQueries(2):
+            response = self.client.get(_url('edit_task', self.task_id))
         self.assertEqual(response.status_code, 404)
 
+    def test_edit_task_view_unauthenticated(self):
+        self.client.logout()
+        url = _url('edit_task', self.task_id)
+        response = self.client.get(url)
+        self.assertRedirects(response, f"{_url('login')}?next={url}")
+
+    def test_edit_task_view_head(self):
+        response = self.client.head(_url('edit_task', self.task_id))
+        self.assertEqual(response.status_code, 200)
+
+    def test_edit_task_view_invalid_id(self):
+        for task_id in ('0', '007'):
+            response = self.client.get(f'/edit/{task_id}/')
+            self.assertEqual(response.status_code, 404)
+
+    def test_edit_task_url_large_id(self):
+        self.assertEqual(_url('edit_task', 1_000_000_000), '/edit/1000000000/')
+
     def test_delete_task_view_get(self):
-        self.client.login(username='testuser', password='testpass')
-        # Create a task
-        response = self.client.post(reverse('api_tasks'), data=json.dumps({
-            'title': 'Test Task',
-            'description': 'Test Description',
-            'status': 'pending'
-        }), content_type='application/json')
-        task_id = response.json()['id']
-        response = self.client.get(reverse('delete_task', args=[task_id]))
+        with self.assertNumQueries(2):
+            response = self.client.get(_url('delete_task', self.task_id))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Delete Task')
 
     def test_delete_task_view_post(self):
-        self.client.login(username='testuser', password='testpass')
-        # Create a task
-        response = self.client.post(reverse('api_tasks'), data=json.dumps({
-            'title': 'Test Task',
-            'description': 'Test Description',
-            'status': 'pending'
-        }), content_type='application/json')
-        task_id = response.json()['id']
-        response = self.client.post(reverse('delete_task', args=[task_id]))
-        self.assertEqual(response.status_code, 302)
+        with self.assertNumQueries(2):
+            response = self.client.post(_url('delete_task', self.task_id))
+        self.assertEqual(response.status_code, 303)
         # Check via API
-        response = self.client.get(reverse('api_task_detail', args=[task_id]))
+        response = self.client.get(_url('api_task_detail', self.task_id))
         self.assertEqual(response.status_code, 404)
 
     def test_delete_task_view_wrong_user(self):
-        # Create task for testuser
-        self.client.login(username='testuser', password='testpass')
-        response = self.client.post(reverse('api_tasks'), data=json.dumps({
-            'title': 'Test Task',
-            'description': 'Test Description',
-            'status': 'pending'
-        }), content_type='application/json')
-        task_id = response.json()['id']
         # Login as user2
         user2 = User.objects.create_user(username='user2', password='pass')
-        self.client.login(username='user2', password='pass')
-        response = self.client.post(reverse('delete_task', args=[task_id]))
+        self.client.force_login(user2)
+        with self.assertNumQueries(2):
+            response = self.client.post(_url('delete_task', self.task_id))
         self.assertEqual(response.status_code, 404)
 
-class APITestCase(TestCase):
+class APITestCase(FastPasswordTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser', password='testpass')
+        cls.task_id = create_task(
+            user_id=cls.user.id,
+            title='Test Task',
+            description='Test Description',
+            due_date=None,
+            status='pending'
+        )
+
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create_user(username='testuser', password='testpass')
-        self.client.login(username='testuser', password='testpass')
-        # Create a task via API
-        response = self.client.post(reverse('api_tasks'), data=json.dumps({
-            'title': 'Test Task',
-            'description': 'Test Description',
-            'status': 'pending'
-        }), content_type='application/json')
-        self.task_id = response.json()['id']
+        self.client.force_login(self.user)
 
     def test_api_tasks_get(self):
-        response = self.client.get(reverse('api_tasks'))
+        response = self.client.get(_url('api_tasks'))
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertIn('tasks', data)
         self.assertEqual(len(data['tasks']), 1)
 
+    def test_api_tasks_get_timestamps_are_utc(self):
+        task = self.client.get(_url('api_tasks')).json()['tasks'][0]
+        # Database-filled timestamps are serialized as UTC with a "Z" suffix
+        self.assertRegex(task['created_at'], r'^\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ$')
+        self.assertRegex(task['updated_at'], r'^\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ$')
+
+    def test_api_tasks_get_not_modified(self):
+        etag = self.client.get(_url('api_tasks'))['ETag']
+        response = self.client.get(_url('api_tasks'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self._post_json(_url('api_tasks'), {'title': 'New Task'})
+        response = self.client.get(_url('api_tasks'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_api_tasks_get_paginated(self):
+        create_tasks_bulk(self.user.id, [{'title': f'Task {i}'} for i in range(3)])
+        response = self.client.get(_url('api_tasks'), {'limit': 2})
+        data = response.json()
+        self.assertEqual([t['title'] for t in data['tasks']], ['Task 2', 'Task 1'])
+        self.assertIsNotNone(data['next_cursor'])
+        response = self.client.get(_url('api_tasks'), {'limit': 2, 'before': data['next_cursor']})
+        data = response.json()
+        self.assertEqual([t['title'] for t in data['tasks']], ['Task 0', 'Test Task'])
+        self.assertIsNone(data['next_cursor'])
+
+    def test_api_tasks_get_invalid_page_params(self):
+        response = self.client.get(_url('api_tasks'), {'limit': 0})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(_url('api_tasks'), {'before': 'garbage'})
+        self.assertEqual(response.status_code, 400)
+
     def test_api_tasks_post(self):
-        response = self.client.post(reverse('api_tasks'), data=json.dumps({
+        response = self._post_json(_url('api_tasks'), {
             'title': 'New Task',
             'description': 'New Description',
             'status': 'in_progress'
-        }), content_type='application/json')
+        })
         self.assertEqual(response.status_code, 201)
         data = response.json()
         self.assertIn('id', data)
 
+    def test_api_tasks_post_bulk(self):
+        response = self._post_json(_url('api_tasks'), [
+            {'title': 'First Task'},
+            {'title': 'Second Task', 'status': 'completed'},
+        ])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['created'], 2)
+        response = self.client.get(_url('api_tasks'))
+        self.assertEqual(len(response.json()['tasks']), 3)
+
+    def test_api_tasks_post_bulk_invalid(self):
+        response = self._post_json(_url('api_tasks'), [{'description': 'No title'}])
+        self.assertEqual(response.status_code, 400)
+
+    def test_api_tasks_post_bulk_bad_item_inserts_nothing(self):
+        items = [{'title': 'a'}, {'title': 'b'}, {'title': {'x': 1}}, {'title': 'd'}]
+        response = self._post_json(_url('api_tasks'), items)
+        self.assertEqual(response.status_code, 400)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM tasks WHERE user_id = %s", [self.user.id])
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+    def test_create_tasks_bulk_is_atomic(self):
+        with self.assertRaises(Exception):
+            create_tasks_bulk(self.user.id, [{'title': 'a'}, {'title': {'x': 1}}])
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM tasks WHERE user_id = %s", [self.user.id])
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+    def test_api_tasks_post_invalid_json(self):
+        response = self.client.generic('POST', _url('api_tasks'), b'{not json', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+    def test_api_tasks_get_cached(self):
+        self.client.get(_url('api_tasks'))
+        # Only the user lookup; the session and task list come from the cache
+        with self.assertNumQueries(1):
+            response = self.client.get(_url('api_tasks'))
+        self.assertEqual(len(response.json()['tasks']), 1)
+
+    def test_api_tasks_cache_invalidated_on_create(self):
+        self.client.get(_url('api_tasks'))
+        self._post_json(_url('api_tasks'), {'title': 'New Task'})
+        response = self.client.get(_url('api_tasks'))
+        self.assertEqual(len(response.json()['tasks']), 2)
+
     def test_api_task_detail_get(self):
-        response = self.client.get(reverse('api_task_detail', args=[self.task_id]))
+        response = self.client.get(_url('api_task_detail', self.task_id))
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertEqual(data['title'], 'Test Task')
 
     def test_api_task_detail_put(self):
-        response = self.client.put(reverse('api_task_detail', args=[self.task_id]), data=json.dumps({
+        response = self._put_json(_url('api_task_detail', self.task_id), {
             'title': 'Updated Task',
             'description': 'Updated Description',
             'status': 'completed'
-        }), content_type='application/json')
+        })
         self.assertEqual(response.status_code, 200)
         # Verify update
-        response = self.client.get(reverse('api_task_detail', args=[self.task_id]))
+        response = self.client.get(_url('api_task_detail', self.task_id))
         data = response.json()
         self.assertEqual(data['title'], 'Updated Task')
 
+    def test_api_task_detail_put_unchanged(self):
+        etag = self.client.get(_url('api_tasks'))['ETag']
+        response = self._put_json(_url('api_task_detail', self.task_id), {
+            'title': 'Test Task',
+            'description': 'Test Description',
+            'status': 'pending'
+        })
+        self.assertEqual(response.status_code, 200)
+        # Nothing was written, so the cached page and its ETag still stand
+        with self.assertNumQueries(1):
+            response = self.client.get(_url('api_tasks'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_api_task_detail_put_non_object(self):
+        for payload in ([], 'x'):
+            response = self._put_json(_url('api_task_detail', self.task_id), payload)
+            self.assertEqual(response.status_code, 400)
+
+    def test_api_task_detail_put_missing(self):
+        response = self._put_json(_url('api_task_detail', self.task_id + 1), {'title': 'Updated Task'})
+        self.assertEqual(response.status_code, 404)
+
     def test_api_task_detail_delete(self):
-        response = self.client.delete(reverse('api_task_detail', args=[self.task_id]))
+        response = self.client.delete(_url('api_task_detail', self.task_id))
         self.assertEqual(response.status_code, 200)
         # Verify delete
-        response = self.client.get(reverse('api_task_detail', args=[self.task_id]))
+        response = self.client.get(_url('api_task_detail', self.task_id))
+        self.assertEqual(response.status_code, 404)
+
+    def test_api_task_detail_delete_missing(self):
+        # User lookup and the DELETE itself; no SELECT beforehand
+        with self.assertNumQueries(2):
+            response = self.client.delete(_url('api_task_detail', self.task_id + 1))
         self.assertEqual(response.status_code, 404)
 
+    def test_api_method_not_allowed(self):
+        response = self.client.patch(_url('api_task_detail', self.task_id))
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(response['Allow'], 'GET, HEAD, PUT, DELETE')
+        self.assertEqual(response.json(), {'error': 'Method not allowed'})
+
+    def test_api_head(self):
+        self.assertEqual(self.client.head(_url('api_tasks')).status_code, 200)
+        self.assertEqual(self.client.head(_url('api_task_detail', self.task_id)).status_code, 200)
+
     def test_api_unauthenticated(self):
         self.client.logout()
-        response = self.client.get(reverse('api_tasks'))
+        response = self.client.get(_url('api_tasks'))
         self.assertEqual(response.status_code, 401)
@@ -1,13 +1,16 @@
+from django.urls import path, register_converter
+from . import converters, views
 
-from django.urls import path
-from . import views
+register_converter(converters.FastIntConverter, 'fastint')
 
 urlpatterns = [
     path('', views.home, name='home'),
     path('register/', views.register, name='register'),
     path('login/', views.user_login, name='login'),
     path('logout/', views.user_logout, name='logout'),
-    path('edit/<int:task_id>/', views.edit_task, name='edit_task'),
-    path('delete/<int:task_id>/', views.delete_task, name='delete_task'),    # API endpoints
+    path('edit/<fastint:task_id>/', views.edit_task, name='edit_task'),
+    path('delete/<fastint:task_id>/', views.delete_task, name='delete_task'),
+    # API endpoints
     path('api/tasks/', views.api_tasks, name='api_tasks'),
-    path('api/tasks/<int:task_id>/', views.api_task_detail, name='api_task_detail'),]
\ No newline at end of file
+    path('api/tasks/<fastint:task_id>/', views.api_task_detail, name='api_task_detail'),
+]
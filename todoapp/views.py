@@ -1,140 +1,352 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
 from django.contrib.auth import login, authenticate, logout
+from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db import connection
-from django.utils import timezone
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import require_http_methods
+from django.views.decorators.vary import vary_on_cookie
+import hashlib
 import logging
-import json
+import time
 
+import orjson
+
+from .decorators import api_login_required, api_require_http_methods
 from .forms import UserRegistrationForm, UserLoginForm, TaskForm
+from .responses import OrjsonResponse, dumps
 
 logger = logging.getLogger(__name__)
 
+# Seconds a user's cached task list stays valid; writes invalidate it sooner
+TASK_LIST_CACHE_TIMEOUT = 300
+
+# Seconds the anonymous landing page is served from the cache
+HOME_ANONYMOUS_CACHE_TIMEOUT = 60 * 60
+
+# Tasks per API list page unless the client asks for another size
+TASK_PAGE_SIZE = 50
+MAX_TASK_PAGE_SIZE = 200
+
+def _task_cache_key(prefix, user_id):
+    return f"{prefix}:{user_id}"
+
+def invalidate_task_cache(user_id):
+    """Drop every cached task list for a user after a write."""
+    cache.delete_many([
+        _task_cache_key('tasks', user_id),
+        _task_cache_key('tasks_list', user_id),
+        _task_cache_key('tasks_json', user_id),
+        _task_cache_key('tasks_version', user_id),
+    ])
+
+def get_tasks_version(user_id):
+    """
+    Return a token that changes whenever the user's cached task lists are dropped.
+    
+    index.html keys its task list fragment on it, so a write makes the next
+    render miss the old fragment.
+    """
+    return cache.get_or_set(_task_cache_key('tasks_version', user_id), time.time_ns, None)
+
+def _redirect_after_post(to):
+    """Redirect with 303 See Other so the browser follows up with a GET."""
+    response = redirect(to)
+    response.status_code = 303
+    return response
+
 # Raw SQL functions for Task CRUD
-def create_task_table():
-    """Create tasks table if it doesn't exist."""
-    with connection.cursor() as cursor:
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                title VARCHAR(200) NOT NULL,
-                description TEXT,
-                due_date DATETIME,
-                status VARCHAR(20) DEFAULT 'pending',
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES auth_user(id)
-            )
-        """)
+# The tasks table is created by migration 0004_create_tasks_table. Its
+# created_at/updated_at columns are filled in by the database.
+# Statements are built once at import, without surrounding whitespace, so
+# every call sends byte-identical SQL and drivers that cache statements by
+# their text get a hit.
+_SQL_INSERT = (
+    "INSERT INTO tasks (user_id, title, description, due_date, status) "
+    "VALUES (%s, %s, %s, %s, %s)"
+)
+_SQL_SELECT = "SELECT id, title, description, due_date, status, created_at, updated_at FROM tasks"
+_SQL_PAGE = (
+    f"{_SQL_SELECT} WHERE user_id = %s "
+    "ORDER BY created_at DESC, id DESC LIMIT %s"
+)
+_SQL_PAGE_BEFORE = (
+    f"{_SQL_SELECT} WHERE user_id = %s AND (created_at, id) < (%s, %s) "
+    "ORDER BY created_at DESC, id DESC LIMIT %s"
+)
+_SQL_LIST = (
+    "SELECT id, title, description, due_date, status, created_at FROM tasks "
+    "WHERE user_id = %s ORDER BY created_at DESC, id DESC"
+)
+_SQL_GET = f"{_SQL_SELECT} WHERE id = %s AND user_id = %s"
+# IS NOT is SQLite's null-safe inequality (IS DISTINCT FROM)
+_SQL_UPDATE = (
+    "UPDATE tasks SET title = %s, description = %s, due_date = %s, status = %s, "
+    "updated_at = CURRENT_TIMESTAMP "
+    "WHERE id = %s AND user_id = %s "
+    "AND (title IS NOT %s OR description IS NOT %s OR due_date IS NOT %s OR status IS NOT %s)"
+)
+_SQL_EXISTS = "SELECT 1 FROM tasks WHERE id = %s AND user_id = %s"
+_SQL_DELETE = "DELETE FROM tasks WHERE id = %s AND user_id = %s"
 
 def create_task(user_id, title, description, due_date, status):
     """Create a new task."""
     try:
         with connection.cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO tasks (user_id, title, description, due_date, status, created_at, updated_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, [user_id, title, description, due_date, status, timezone.now(), timezone.now()])
-            return cursor.lastrowid
+            cursor.execute(_SQL_INSERT, [user_id, title, description, due_date, status])
+            task_id = cursor.lastrowid
+    except Exception as e:
+        logger.error("Error creating task: %s", e)
+        raise
+    invalidate_task_cache(user_id)
+    return task_id
+
+def create_tasks_bulk(user_id, tasks):
+    """
+    Create several tasks in one round trip; returns the number inserted.
+    
+    The batch is atomic: if any row fails, none are inserted.
+    """
+    rows = [
+        (user_id, task['title'], task.get('description', ''), task.get('due_date'),
+         task.get('status', 'pending'))
+        for task in tasks
+    ]
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(_SQL_INSERT, rows)
+    except Exception as e:
+        logger.error("Error creating tasks in bulk: %s", e)
+        raise
+    invalidate_task_cache(user_id)
+    return len(rows)
+
+def get_tasks(user_id, limit=TASK_PAGE_SIZE, before=None):
+    """
+    Get one page of a user's tasks, newest first.
+    
+    Returns ``(tasks, next_cursor)``. ``before`` is a ``(created_at, id)`` pair
+    taken from a previous page's cursor; the seek keeps every page an index
+    range scan. The default first page is served from the cache when possible.
+    """
+    cacheable = before is None and limit == TASK_PAGE_SIZE
+    key = _task_cache_key('tasks', user_id)
+    if cacheable:
+        page = cache.get(key)
+        if page is not None:
+            return page
+    if before is None:
+        sql, params = _SQL_PAGE, [user_id, limit + 1]
+    else:
+        sql, params = _SQL_PAGE_BEFORE, [user_id, *before, limit + 1]
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            columns = [col[0] for col in cursor.description]
+            tasks = [dict(zip(columns, row)) for row in cursor.fetchall()]
     except Exception as e:
-        logger.error(f"Error creating task: {e}")
+        logger.error("Error getting tasks: %s", e)
         raise
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        last = tasks[-1]
+        next_cursor = f"{last['created_at']},{last['id']}"
+    page = (tasks, next_cursor)
+    if cacheable:
+        cache.set(key, page, TASK_LIST_CACHE_TIMEOUT)
+    return page
 
-def get_tasks(user_id):
-    """Get all tasks for a user."""
+def get_tasks_list(user_id):
+    """Get a user's tasks with only the columns the home page renders."""
+    key = _task_cache_key('tasks_list', user_id)
+    tasks = cache.get(key)
+    if tasks is not None:
+        return tasks
     try:
         with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT id, title, description, due_date, status, created_at, updated_at
-                FROM tasks
-                WHERE user_id = %s
-                ORDER BY created_at DESC
-            """, [user_id])
+            cursor.execute(_SQL_LIST, [user_id])
             columns = [col[0] for col in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            tasks = [dict(zip(columns, row)) for row in cursor.fetchall()]
     except Exception as e:
-        logger.error(f"Error getting tasks: {e}")
+        logger.error("Error getting task list: %s", e)
         raise
+    cache.set(key, tasks, TASK_LIST_CACHE_TIMEOUT)
+    return tasks
+
+def get_tasks_payload(user_id, limit=TASK_PAGE_SIZE, before=None):
+    """
+    Return ``(etag, body)`` for one serialized page of a user's tasks.
+    
+    The ETag is a hash of the JSON body. For the default first page both are
+    cached together, so a conditional GET that matches costs one cache lookup
+    and no serialization.
+    """
+    cacheable = before is None and limit == TASK_PAGE_SIZE
+    key = _task_cache_key('tasks_json', user_id)
+    payload = cache.get(key) if cacheable else None
+    if payload is None:
+        tasks, next_cursor = get_tasks(user_id, limit, before)
+        body = dumps({'tasks': tasks, 'next_cursor': next_cursor})
+        etag = quote_etag(hashlib.md5(body, usedforsecurity=False).hexdigest())
+        payload = (etag, body)
+        if cacheable:
+            cache.set(key, payload, TASK_LIST_CACHE_TIMEOUT)
+    return payload
+
+def parse_page_params(params):
+    """
+    Read ``limit`` and ``before`` from a query dict.
+    
+    Raises ValueError for a non-numeric or out-of-range limit or a malformed
+    cursor.
+    """
+    limit = int(params.get('limit', TASK_PAGE_SIZE))
+    if not 1 <= limit <= MAX_TASK_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_TASK_PAGE_SIZE}")
+    before = params.get('before')
+    if before is not None:
+        created_at, _, task_id = before.rpartition(',')
+        if not created_at:
+            raise ValueError("before must be a cursor returned by a previous page")
+        before = (created_at, int(task_id))
+    return limit, before
+
+# Task fields an API body may set, and whether each one may be null
+_TASK_FIELDS = (
+    ('title', False),
+    ('description', True),
+    ('due_date', True),
+    ('status', False),
+)
+
+def parse_task_data(data):
+    """
+    Read a task's fields from a decoded JSON object.
+    
+    Raises KeyError if the title is missing and TypeError if ``data`` is not
+    an object or a field is not a string (or null, where allowed).
+    """
+    task = {
+        'title': data['title'],
+        'description': data.get('description', ''),
+        'due_date': data.get('due_date'),
+        'status': data.get('status', 'pending'),
+    }
+    for name, nullable in _TASK_FIELDS:
+        value = task[name]
+        if not isinstance(value, str) and not (nullable and value is None):
+            raise TypeError(f"{name} must be a string")
+    return task
 
 def get_task(task_id, user_id):
     """Get a specific task."""
     try:
         with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT id, title, description, due_date, status, created_at, updated_at
-                FROM tasks
-                WHERE id = %s AND user_id = %s
-            """, [task_id, user_id])
+            cursor.execute(_SQL_GET, [task_id, user_id])
             row = cursor.fetchone()
             if row:
                 columns = [col[0] for col in cursor.description]
                 return dict(zip(columns, row))
             return None
     except Exception as e:
-        logger.error(f"Error getting task: {e}")
+        logger.error("Error getting task: %s", e)
         raise
 
 def update_task(task_id, user_id, title, description, due_date, status):
-    """Update a task."""
+    """
+    Update a task.
+    
+    Returns True if the task exists, whether or not anything changed. A save
+    that repeats the stored values matches no rows, so it writes nothing,
+    keeps updated_at and leaves the cached lists alone; only then does a
+    second query tell an unchanged task from a missing one.
+    """
+    values = [title, description, due_date, status]
     try:
         with connection.cursor() as cursor:
-            cursor.execute("""
-                UPDATE tasks
-                SET title = %s, description = %s, due_date = %s, status = %s, updated_at = %s
-                WHERE id = %s AND user_id = %s
-            """, [title, description, due_date, status, timezone.now(), task_id, user_id])
-            return cursor.rowcount > 0
+            cursor.execute(_SQL_UPDATE, values + [task_id, user_id] + values)
+            changed = found = cursor.rowcount > 0
+            if not changed:
+                cursor.execute(_SQL_EXISTS, [task_id, user_id])
+                found = cursor.fetchone() is not None
     except Exception as e:
-        logger.error(f"Error updating task: {e}")
+        logger.error("Error updating task: %s", e)
         raise
+    if changed:
+        invalidate_task_cache(user_id)
+    return found
 
 def delete_task_db(task_id, user_id):
     """Delete a task."""
     try:
         with connection.cursor() as cursor:
-            cursor.execute("""
-                DELETE FROM tasks
-                WHERE id = %s AND user_id = %s
-            """, [task_id, user_id])
-            return cursor.rowcount > 0
+            cursor.execute(_SQL_DELETE, [task_id, user_id])
+            deleted = cursor.rowcount > 0
     except Exception as e:
-        logger.error(f"Error deleting task: {e}")
+        logger.error("Error deleting task: %s", e)
         raise
-
-# Ensure table exists
-create_task_table()
+    if deleted:
+        invalidate_task_cache(user_id)
+    return deleted
 
 def home(request):
     if request.user.is_authenticated:
-        if request.method == 'POST':
-            form = TaskForm(request.POST)
-            if form.is_valid():
-                try:
-                    create_task(
-                        user_id=request.user.id,
-                        title=form.cleaned_data['title'],
-                        description=form.cleaned_data['description'],
-                        due_date=form.cleaned_data['due_date'],
-                        status=form.cleaned_data['status']
-                    )
-                    messages.success(request, 'Task added successfully.')
-                    return redirect('home')
-                except Exception as e:
-                    messages.error(request, 'Error adding task.')
-                    logger.error(f"Error in home POST: {e}")
-        else:
-            form = TaskForm()
-        try:
-            tasks = get_tasks(request.user.id)
-        except Exception as e:
-            tasks = []
-            messages.error(request, 'Error loading tasks.')
-            logger.error(f"Error in home GET: {e}")
-        return render(request, "index.html", {'tasks': tasks, 'form': form})
+        return home_authenticated(request)
+    return home_anonymous(request)
+
+@cache_page(HOME_ANONYMOUS_CACHE_TIMEOUT)
+@vary_on_cookie
+def home_anonymous(request):
+    """
+    Render the landing page for visitors who are not logged in.
+    
+    The page is the same for every anonymous visitor, so it is cached. Varying
+    on Cookie keeps it away from requests that carry a session.
+    """
     return render(request, "index.html")
 
+def home_authenticated(request):
+    """Render the task list and handle the add-task form."""
+    uid = request.user.pk
+    if request.method == 'POST':
+        form = TaskForm(request.POST)
+        if form.is_valid():
+            try:
+                create_task(
+                    user_id=uid,
+                    title=form.cleaned_data['title'],
+                    description=form.cleaned_data['description'],
+                    due_date=form.cleaned_data['due_date'],
+                    status=form.cleaned_data['status']
+                )
+                messages.success(request, 'Task added successfully.')
+                return _redirect_after_post('home')
+            except Exception as e:
+                messages.error(request, 'Error adding task.')
+                logger.error("Error in home POST: %s", e)
+    else:
+        form = TaskForm()
+    # Read the version before the list, so a write in between can only leave
+    # a fragment under a version that is already stale
+    tasks_version = get_tasks_version(uid)
+    try:
+        tasks = get_tasks_list(uid)
+    except Exception as e:
+        tasks = []
+        tasks_version = None
+        messages.error(request, 'Error loading tasks.')
+        logger.error("Error in home GET: %s", e)
+    # The cached fragment embeds CSRF tokens, so the secret must exist before
+    # the template builds the fragment key from it
+    get_token(request)
+    return render(request, "index.html", {'tasks': tasks, 'form': form, 'tasks_version': tasks_version})
+
 def register(request):
     """
     Handle user registration with form validation, logging, and exception handling.
@@ -149,14 +361,14 @@ def register(request):
                 user = form.save()
                 login(request, user)
                 messages.success(request, 'Registration successful. You are now logged in.')
-                logger.info(f"User {user.username} registered successfully.")
-                return redirect('home')
+                logger.info("User %s registered successfully.", user.username)
+                return _redirect_after_post('home')
             except Exception as e:
-                logger.error(f"Error during user registration: {str(e)}")
+                logger.error("Error during user registration: %s", e)
                 messages.error(request, 'An error occurred during registration. Please try again.')
                 form.add_error(None, 'Registration failed due to an internal error.')
         else:
-            logger.warning(f"Invalid registration form submission: {form.errors}")
+            logger.warning("Invalid registration form submission: %s", form.errors)
     else:
         form = UserRegistrationForm()
     
@@ -179,16 +391,16 @@ def user_login(request):
                 try:
                     login(request, user)
                     messages.success(request, f'Welcome back, {username}!')
-                    logger.info(f"User {username} logged in successfully.")
-                    return redirect('home')
+                    logger.info("User %s logged in successfully.", username)
+                    return _redirect_after_post('home')
                 except Exception as e:
-                    logger.error(f"Error during login for user {username}: {str(e)}")
+                    logger.error("Error during login for user %s: %s", username, e)
                     messages.error(request, 'An error occurred during login. Please try again.')
             else:
                 messages.error(request, 'Invalid username or password.')
-                logger.warning(f"Failed login attempt for username: {username}")
+                logger.warning("Failed login attempt for username: %s", username)
         else:
-            logger.warning(f"Invalid login form submission: {form.errors}")
+            logger.warning("Invalid login form submission: %s", form.errors)
     else:
         form = UserLoginForm()
     
@@ -202,137 +414,148 @@ def user_logout(request):
         username = request.user.username
         logout(request)
         messages.success(request, 'You have been logged out successfully.')
-        logger.info(f"User {username} logged out.")
+        logger.info("User %s logged out.", username)
     return redirect('home')
 
+@require_http_methods(["GET", "HEAD", "POST"])
+@login_required
 def delete_task(request, task_id):
-    try:
-        task = get_task(task_id, request.user.id)
-        if not task:
-            return HttpResponse('Task not found', status=404)
-    except Exception as e:
-        logger.error(f"Error getting task for delete: {e}")
-        return HttpResponse('Error', status=500)
-    
+    uid = request.user.pk
     if request.method == 'POST':
         try:
-            delete_task_db(task_id, request.user.id)
+            # The DELETE is scoped to the owner, so its row count doubles as
+            # the existence check
+            if not delete_task_db(task_id, uid):
+                return HttpResponse('Task not found', status=404)
             messages.success(request, 'Task deleted successfully.')
-            return redirect('home')
+            return _redirect_after_post('home')
         except Exception as e:
             messages.error(request, 'Error deleting task.')
-            logger.error(f"Error in delete_task POST: {e}")
+            logger.error("Error in delete_task POST: %s", e)
+    
+    try:
+        task = get_task(task_id, uid)
+        if not task:
+            return HttpResponse('Task not found', status=404)
+    except Exception as e:
+        logger.error("Error getting task for delete: %s", e)
+        return HttpResponse('Error', status=500)
     return render(request, 'delete_confirm.html', {'task': task})
 
 # API Endpoints
+@api_require_http_methods(["GET", "HEAD", "POST"])
+@api_login_required
 def api_tasks(request):
-    """API endpoint for tasks: GET to list, POST to create."""
-    if not request.user.is_authenticated:
-        return JsonResponse({'error': 'Authentication required'}, status=401)
-    
-    if request.method == 'GET':
+    """API endpoint for tasks: GET to list a page, POST to create."""
+    uid = request.user.pk
+    if request.method in ('GET', 'HEAD'):
+        try:
+            limit, before = parse_page_params(request.GET)
+        except ValueError:
+            return OrjsonResponse({'error': 'Invalid pagination parameters'}, status=400)
         try:
-            tasks = get_tasks(request.user.id)
-            return JsonResponse({'tasks': tasks}, safe=False)
+            etag, body = get_tasks_payload(uid, limit, before)
         except Exception as e:
-            logger.error(f"Error in api_tasks GET: {e}")
-            return JsonResponse({'error': 'Internal server error'}, status=500)
+            logger.error("Error in api_tasks GET: %s", e)
+            return OrjsonResponse({'error': 'Internal server error'}, status=500)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        return response
     
     elif request.method == 'POST':
         try:
-            data = json.loads(request.body)
-            task_id = create_task(
-                user_id=request.user.id,
-                title=data['title'],
-                description=data.get('description', ''),
-                due_date=data.get('due_date'),
-                status=data.get('status', 'pending')
-            )
-            return JsonResponse({'id': task_id, 'message': 'Task created'}, status=201)
-        except (KeyError, json.JSONDecodeError) as e:
-            return JsonResponse({'error': 'Invalid data'}, status=400)
+            data = orjson.loads(request.body)
+            if isinstance(data, list):
+                # Every item is checked before anything is inserted
+                tasks = [parse_task_data(item) for item in data]
+                count = create_tasks_bulk(uid, tasks)
+                return OrjsonResponse({'created': count, 'message': 'Tasks created'}, status=201)
+            task_id = create_task(user_id=uid, **parse_task_data(data))
+            return OrjsonResponse({'id': task_id, 'message': 'Task created'}, status=201)
+        except (KeyError, TypeError, orjson.JSONDecodeError) as e:
+            return OrjsonResponse({'error': 'Invalid data'}, status=400)
         except Exception as e:
-            logger.error(f"Error in api_tasks POST: {e}")
-            return JsonResponse({'error': 'Internal server error'}, status=500)
-    
-    return JsonResponse({'error': 'Method not allowed'}, status=405)
+            logger.error("Error in api_tasks POST: %s", e)
+            return OrjsonResponse({'error': 'Internal server error'}, status=500)
 
+@api_require_http_methods(["GET", "HEAD", "PUT", "DELETE"])
+@api_login_required
 def api_task_detail(request, task_id):
     """API endpoint for task detail: GET, PUT, DELETE."""
-    if not request.user.is_authenticated:
-        return JsonResponse({'error': 'Authentication required'}, status=401)
-    
-    try:
-        task = get_task(task_id, request.user.id)
+    uid = request.user.pk
+    if request.method in ('GET', 'HEAD'):
+        try:
+            task = get_task(task_id, uid)
+        except Exception as e:
+            logger.error("Error getting task in api_task_detail: %s", e)
+            return OrjsonResponse({'error': 'Internal server error'}, status=500)
         if not task:
-            return JsonResponse({'error': 'Task not found'}, status=404)
-    except Exception as e:
-        logger.error(f"Error getting task in api_task_detail: {e}")
-        return JsonResponse({'error': 'Internal server error'}, status=500)
-    
-    if request.method == 'GET':
-        return JsonResponse(task)
+            return OrjsonResponse({'error': 'Task not found'}, status=404)
+        return OrjsonResponse(task)
     
+    # PUT and DELETE are scoped to the owner, so the affected row count is
+    # the existence check; no SELECT is needed first.
     elif request.method == 'PUT':
         try:
-            data = json.loads(request.body)
-            success = update_task(
-                task_id=task_id,
-                user_id=request.user.id,
-                title=data['title'],
-                description=data.get('description', ''),
-                due_date=data.get('due_date'),
-                status=data.get('status', 'pending')
-            )
+            data = orjson.loads(request.body)
+            success = update_task(task_id=task_id, user_id=uid, **parse_task_data(data))
             if success:
-                return JsonResponse({'message': 'Task updated'})
+                return OrjsonResponse({'message': 'Task updated'})
             else:
-                return JsonResponse({'error': 'Update failed'}, status=400)
-        except (KeyError, json.JSONDecodeError) as e:
-            return JsonResponse({'error': 'Invalid data'}, status=400)
+                return OrjsonResponse({'error': 'Task not found'}, status=404)
+        except (KeyError, TypeError, orjson.JSONDecodeError) as e:
+            return OrjsonResponse({'error': 'Invalid data'}, status=400)
         except Exception as e:
-            logger.error(f"Error in api_task_detail PUT: {e}")
-            return JsonResponse({'error': 'Internal server error'}, status=500)
+            logger.error("Error in api_task_detail PUT: %s", e)
+            return OrjsonResponse({'error': 'Internal server error'}, status=500)
     
     elif request.method == 'DELETE':
         try:
-            success = delete_task_db(task_id, request.user.id)
+            success = delete_task_db(task_id, uid)
             if success:
-                return JsonResponse({'message': 'Task deleted'})
+                return OrjsonResponse({'message': 'Task deleted'})
             else:
-                return JsonResponse({'error': 'Delete failed'}, status=400)
+                return OrjsonResponse({'error': 'Task not found'}, status=404)
         except Exception as e:
-            logger.error(f"Error in api_task_detail DELETE: {e}")
-            return JsonResponse({'error': 'Internal server error'}, status=500)
-    
-    return JsonResponse({'error': 'Method not allowed'}, status=405)
+            logger.error("Error in api_task_detail DELETE: %s", e)
+            return OrjsonResponse({'error': 'Internal server error'}, status=500)
 
+@require_http_methods(["GET", "HEAD", "POST"])
+@login_required
 def edit_task(request, task_id):
-    try:
-        task = get_task(task_id, request.user.id)
-        if not task:
-            return HttpResponse('Task not found', status=404)
-    except Exception as e:
-        logger.error(f"Error getting task for edit: {e}")
-        return HttpResponse('Error', status=500)
-    
+    uid = request.user.pk
     if request.method == 'POST':
         form = TaskForm(request.POST)
         if form.is_valid():
             try:
-                update_task(
+                # The UPDATE is scoped to the owner, so its row count doubles
+                # as the existence check
+                updated = update_task(
                     task_id=task_id,
-                    user_id=request.user.id,
+                    user_id=uid,
                     title=form.cleaned_data['title'],
                     description=form.cleaned_data['description'],
                     due_date=form.cleaned_data['due_date'],
                     status=form.cleaned_data['status']
                 )
+                if not updated:
+                    return HttpResponse('Task not found', status=404)
                 messages.success(request, 'Task updated successfully.')
-                return redirect('home')
+                return _redirect_after_post('home')
             except Exception as e:
                 messages.error(request, 'Error updating task.')
-                logger.error(f"Error in edit_task POST: {e}")
-    else:
+                logger.error("Error in edit_task POST: %s", e)
+    
+    try:
+        task = get_task(task_id, uid)
+        if not task:
+            return HttpResponse('Task not found', status=404)
+    except Exception as e:
+        logger.error("Error getting task for edit: %s", e)
+        return HttpResponse('Error', status=500)
+    
+    if request.method != 'POST':
         form = TaskForm(initial=task)
     return render(request, 'edit_task.html', {'form': form, 'task': task})
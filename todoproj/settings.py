@@ -63,10 +63,43 @@ WSGI_APPLICATION = 'todoproj.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+# Connections are kept open between requests. On PostgreSQL, either add
+# "OPTIONS": {"pool": {"max_size": 25}} (Django's built-in psycopg pool, with
+# CONN_MAX_AGE = 0) or put PgBouncer in transaction mode in front of it and
+# set DISABLE_SERVER_SIDE_CURSORS = True.
+#
+# The task queries in todoapp.views always send identical SQL text, so each
+# persistent connection reuses its compiled statements: sqlite3 keeps a
+# per-connection cache of them. On PostgreSQL with psycopg 3, add
+# "prepare_threshold": 0 to OPTIONS so every query is prepared server-side,
+# but not when PgBouncer runs in transaction mode.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+# Task lists, username checks, pages and sessions are cached, and writes
+# invalidate them, so every worker must see the same cache: a per-process
+# backend like LocMemCache would keep serving stale task lists (and logged-out
+# sessions) from the workers that did not handle the write. The file-based
+# backend is shared by all workers on the host, which the SQLite database
+# already requires; across several hosts, use
+# 'django.core.cache.backends.redis.RedisCache' instead.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.django_cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
     }
 }
 
@@ -90,6 +123,34 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Authentication
+# https://docs.djangoproject.com/en/6.0/ref/settings/#login-url
+
+LOGIN_URL = 'login'
+
+# Sessions are read from the cache and written through to the database, so
+# the per-request session lookup usually skips the database. This is only
+# safe with the shared cache backend configured under CACHES: with a
+# per-process cache, a logout or key rotation in one worker would leave the
+# old session id valid in the others. Use the plain 'db' engine with any
+# per-process cache backend.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/6.0/topics/auth/passwords/#using-argon2-with-django
+
+# Argon2 is used for new hashes; the others stay so existing hashes still
+# verify and get upgraded on the next login.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
 
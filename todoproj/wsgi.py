@@ -2,7 +2,12 @@
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'todoproj.settings')
 
 application = get_wsgi_application()
+
+# Build the URL resolver's lookup tables at worker start instead of on the
+# first request.
+get_resolver().reverse_dict